@@ -1,4 +1,5 @@
-import os, re, io, logging, requests, csv, datetime, sqlite3, psycopg
+import os, re, io, logging, requests, csv, datetime, sqlite3, psycopg, time
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
 from pathlib import Path
 
@@ -40,8 +41,12 @@ class BoursoBankExporter:
         self.__matrix_random_challenge: str = re.search(r"\$\(\"\[data-matrix-random-challenge\]\"\)\.val\(\"([^\"]*)\"\)", response.text).group(1)
 
 
-    def __init__(self) -> None:
+    def __init__(self, offline: bool = False, client_id: str = None) -> None:
         """Constructeur de la classe BoursoBankExporter.
+
+        Args:
+            offline (bool, optional): Mode hors ligne, sans session BoursoBank (réimport des exports csv). Defaults to False.
+            client_id (str, optional): Identifiant client, nécessaire en mode hors ligne pour identifier la table. Defaults to None.
         """
         logger.info("Initialisation de l'exporteur")
         self.__IMG_LEN_TO_DIGIT: dict[int, int] = {
@@ -61,7 +66,11 @@ class BoursoBankExporter:
         self.__matrix_random_challenge: str = None
         self.__digits_mapping: dict[str, str] = {}
         self.__is_logged: bool = False
-        self.__client_id: str = None
+        self.__client_id: str = client_id
+
+        if offline:
+            logger.info("Mode hors ligne, aucune connexion à BoursoBank ne sera établie")
+            return
 
         # Création de la session
         self.__create_session()
@@ -151,8 +160,11 @@ class BoursoBankExporter:
             if table_req.fetchone() == None:
                 return None
             
-            last_date_req: sqlite3.Cursor | psycopg.Cursor = cur.execute(f"SELECT MAX(dateOp) FROM client_{self.__client_id} WHERE accountId = '{account_id}' AND dateOp <> '' AND dateOp IS NOT NULL;")
-            last_date_row: any = last_date_req.fetchone()
+            if output_type == "postgresql" and self.__is_partitioned_table(cur):
+                last_date_row: any = self.__get_last_partitioned_transaction_date(account_id, cur)
+            else:
+                last_date_req: sqlite3.Cursor | psycopg.Cursor = cur.execute(f"SELECT MAX(dateOp) FROM client_{self.__client_id} WHERE accountId = '{account_id}' AND dateOp <> '' AND dateOp IS NOT NULL;")
+                last_date_row: any = last_date_req.fetchone()
 
             con.close()
 
@@ -231,36 +243,131 @@ class BoursoBankExporter:
         return from_date, to_date
 
 
-    def export_data(self, account_id: str, from_date: str, to_date: str) -> tuple[bytes, str, str]:
-        """Retourne les transactions entre les dates spécifiées, pour le compte spécifié.
+    def __get_known_accounts(self, output_type: str, db: str) -> dict[str, str]:
+        """Récupère la correspondance entre les numéros de comptes et les identifiants de comptes déjà présents dans la base de donnée spécifiée.
 
         Args:
-            account_id (str): Numéro de compte à exporter.
-            from_date (str): Date de début des transactions (DD/MM/YYYY).
-            to_date (str): Date de fin des transactions (DD/MM/YYYY).
+            output_type (str): Type d'export, pour identifier la DB à vérifier.
+            db (str): Chemin ou chaine de connexion vers la base de données.
 
         Returns:
-            bytes: Export des transactions au format binaire.
+            dict[str, str]: Identifiant de compte associé à chaque numéro de compte connu.
         """
-        logger.info(f"Export des données du {from_date} au {to_date} pour le compte {account_id}")
+        if output_type == "sqlite":
+            # Vérification de l'existende de la db
+            if not os.path.isfile(db):
+                return {}
 
-        # Vérification de la connexion
-        if not self.__is_logged:
-            logger.error("Veuillez d'abord vous connecter")
-            return None
-        
-        # Vérification du format des dates
-        pattern: re.Pattern = re.compile(r"^\d{2}\/\d{2}\/\d{4}$")
-        if from_date is None or from_date == "" or to_date is None or to_date == "":
-            logger.error("Les dates doivent être renseignés")
-            return None
-        if not pattern.match(from_date) or not pattern.match(to_date):
-            logger.error("Les dates doivent être au format DD/MM/YYYY")
-            return None
+        try:
+            if output_type == "sqlite":
+                con: sqlite3.Connection = sqlite3.connect(db)
+                req: str = f"SELECT name FROM sqlite_master WHERE type='table' AND name='client_{self.__client_id}';"
+            elif output_type == "postgresql":
+                con: psycopg.Connection = psycopg.connect(db)
+                req: str = f"SELECT tablename FROM pg_tables WHERE tablename='client_{self.__client_id}';"
+
+            cur: sqlite3.Cursor | psycopg.Cursor = con.cursor()
+
+            # Vérification de l'existence de la table
+            table_req: sqlite3.Cursor | psycopg.Cursor = cur.execute(req)
+            if table_req.fetchone() == None:
+                return {}
+
+            accounts_req: sqlite3.Cursor | psycopg.Cursor = cur.execute(f"SELECT DISTINCT accountNum, accountId FROM client_{self.__client_id} WHERE accountNum <> '' AND accountNum IS NOT NULL;")
+            known_accounts: dict[str, str] = {row[0]: row[1] for row in accounts_req.fetchall()}
+
+            con.close()
+
+            return known_accounts
+        except:
+            logger.error("Impossible de récupérer la correspondance entre les numéros de comptes et les identifiants de comptes")
+            return {}
+
+
+    def __get_known_accounts_from_csv(self, folder: str, accounts_id: list[str]) -> dict[str, str]:
+        """Récupère la correspondance entre les numéros de comptes et les identifiants de comptes à partir des fichiers csv produits par `write_to_csv`.
+
+        Args:
+            folder (str): Chemin vers le dossier contenant les exports csv.
+            accounts_id (list[str]): Identifiants des comptes recherchés.
+
+        Returns:
+            dict[str, str]: Identifiant de compte associé à chaque numéro de compte connu.
+        """
+        if folder is None or folder == "":
+            folder = "."
+        if not os.path.isdir(folder):
+            return {}
+
+        pattern: re.Pattern = re.compile(r"^([\da-zA-Z]+)_\d{8}-\d{8}\.csv$")
+
+        known_accounts: dict[str, str] = {}
+        # Tri décroissant pour lire en priorité l'export le plus récent de chaque compte
+        for file_name in sorted(os.listdir(folder), reverse=True):
+            match: re.Match = pattern.match(file_name)
+            if match is None or match.group(1) not in accounts_id or match.group(1) in known_accounts.values():
+                continue
+
+            try:
+                with open(os.path.join(folder, file_name), "r", encoding="utf-8-sig", newline="") as f:
+                    row: dict[str, str] = next(csv.DictReader(f, delimiter=";"), None)
+            except:
+                logger.error(f"Impossible de lire le fichier '{file_name}'")
+                continue
+
+            if row is not None and row.get("accountNum") is not None and row["accountNum"] != "":
+                known_accounts[row["accountNum"]] = match.group(1)
+
+        return known_accounts
+
+
+    def validate_shared_dates(self, accounts_id: list[str], from_date: str, to_date: str, output_types: list[str], db_path: str, pg_uri: str) -> tuple[str, str]:
+        """Valide les dates passées en paramètre pour un export commun à plusieurs comptes.
+        Les dates de chaque compte sont déduites comme pour `validate_dates`, puis la période retenue
+        est celle qui couvre l'ensemble des comptes (date de début la plus ancienne, date de fin la plus récente).
+
+        Args:
+            accounts_id (list[str]): Numéros de comptes à exporter.
+            from_date (str): Date de début spécifiée par l'utilisateur.
+            to_date (str): Date de fin spécifiée par l'utilisateur.
+            output_types (list[str]): Types d'exports demandés.
+            db_path (str): Chemin vers la base de données.
+            pg_uri (str): Chaîne de connexion à la base PostgreSQL.
+
+        Returns:
+            tuple[str, str]: La date de début et date de fin communes.
+        """
+        from_dates: list[str] = []
+        to_dates: list[str] = []
+        for account_id in accounts_id:
+            account_from_date, account_to_date = self.validate_dates(account_id, from_date, to_date, output_types, db_path, pg_uri)
+            from_dates.append(account_from_date)
+            to_dates.append(account_to_date)
+
+        # Comparaison des dates au format YYYYMMDD
+        sort_key = lambda date: date[6:] + date[3:5] + date[0:2]
+        shared_from_date: str = min(from_dates, key=sort_key)
+        shared_to_date: str = max(to_dates, key=sort_key)
+
+        logger.info(f"Période commune aux comptes : du {shared_from_date} au {shared_to_date}")
 
+        return shared_from_date, shared_to_date
+
+
+    def __request_export(self, accounts_id: list[str], from_date: str, to_date: str) -> bytes:
+        """Demande à BoursoBank l'export des transactions entre les dates spécifiées, pour les comptes spécifiés.
+
+        Args:
+            accounts_id (list[str]): Numéros de comptes à exporter.
+            from_date (str): Date de début des transactions (DD/MM/YYYY).
+            to_date (str): Date de fin des transactions (DD/MM/YYYY).
+
+        Returns:
+            bytes: Export des transactions au format binaire, ou None en cas d'erreur.
+        """
         # Requête
-        params: dict[str, str] = {
-            "movementSearch[selectedAccounts][]": account_id,
+        params: dict[str, str | list[str]] = {
+            "movementSearch[selectedAccounts][]": accounts_id,
             "movementSearch[fromDate]": from_date,
             "movementSearch[toDate]": to_date,
             "movementSearch[format]": "CSV",
@@ -274,10 +381,161 @@ class BoursoBankExporter:
         response: requests.Response = self.__http_session.get("https://clients.boursobank.com/budget/exporter-mouvements", params=params)
         if response.content.decode("utf-8-sig").startswith("<!DOCTYPE html>"):
             logger.error("Bourso a renvoyé une page HTML, ce qui indique une erreur. Il est possible qu'il n'existe aucune opération pour la période spécifiée.")
-            return None, from_date, to_date
+            return None
         else:
-            return response.content, from_date, to_date
-    
+            return response.content
+
+
+    def __check_export_parameters(self, from_date: str, to_date: str) -> bool:
+        """Vérifie que la connexion est établie et que les dates d'export sont valides.
+
+        Args:
+            from_date (str): Date de début des transactions (DD/MM/YYYY).
+            to_date (str): Date de fin des transactions (DD/MM/YYYY).
+
+        Returns:
+            bool: Indique si l'export peut être réalisé.
+        """
+        # Vérification de la connexion
+        if not self.__is_logged:
+            logger.error("Veuillez d'abord vous connecter")
+            return False
+
+        # Vérification du format des dates
+        pattern: re.Pattern = re.compile(r"^\d{2}\/\d{2}\/\d{4}$")
+        if from_date is None or from_date == "" or to_date is None or to_date == "":
+            logger.error("Les dates doivent être renseignés")
+            return False
+        if not pattern.match(from_date) or not pattern.match(to_date):
+            logger.error("Les dates doivent être au format DD/MM/YYYY")
+            return False
+
+        return True
+
+
+    def export_data(self, account_id: str, from_date: str, to_date: str) -> tuple[bytes, str, str]:
+        """Retourne les transactions entre les dates spécifiées, pour le compte spécifié.
+
+        Args:
+            account_id (str): Numéro de compte à exporter.
+            from_date (str): Date de début des transactions (DD/MM/YYYY).
+            to_date (str): Date de fin des transactions (DD/MM/YYYY).
+
+        Returns:
+            bytes: Export des transactions au format binaire.
+        """
+        logger.info(f"Export des données du {from_date} au {to_date} pour le compte {account_id}")
+
+        if not self.__check_export_parameters(from_date, to_date):
+            return None, from_date, to_date
+
+        return self.__request_export([account_id], from_date, to_date), from_date, to_date
+
+
+    def __split_by_account_num(self, data: bytes) -> dict[str, bytes]:
+        """Découpe un export multi-comptes en un export par numéro de compte, à partir de la colonne `accountNum`.
+
+        Args:
+            data (bytes): Export des transactions au format binaire.
+
+        Returns:
+            dict[str, bytes]: Export binaire de chaque numéro de compte présent dans les données.
+        """
+        io_data: io.StringIO = io.StringIO(data.decode("utf-8-sig"))
+        dict_reader: csv.DictReader = csv.DictReader(io_data, delimiter=";")
+
+        rows_by_account_num: dict[str, list[dict[str, str]]] = {}
+        for row in dict_reader:
+            rows_by_account_num.setdefault(row["accountNum"], []).append(row)
+
+        splitted_data: dict[str, bytes] = {}
+        for account_num, rows in rows_by_account_num.items():
+            io_account: io.StringIO = io.StringIO()
+            dict_writer: csv.DictWriter = csv.DictWriter(io_account, fieldnames=dict_reader.fieldnames, delimiter=";", lineterminator="\n")
+            dict_writer.writeheader()
+            dict_writer.writerows(rows)
+            splitted_data[account_num] = io_account.getvalue().encode("utf-8-sig")
+
+        return splitted_data
+
+
+    def export_data_multi(self, accounts_id: list[str], from_date: str, to_date: str, output_types: list[str], db_path: str, pg_uri: str, export_path: str = None) -> tuple[dict[str, bytes], str, str]:
+        """Retourne les transactions entre les dates spécifiées pour plusieurs comptes, en une seule requête.
+        Les opérations sont ensuite réparties par compte grâce à la colonne `accountNum` de l'export.
+
+        La correspondance entre numéro de compte et identifiant de compte est déduite des exports csv déjà présents
+        dans le dossier d'export et des opérations déjà présentes dans les bases SQLite/PostgreSQL, ou par élimination
+        s'il ne reste qu'un seul compte à associer. Les comptes qui ne peuvent pas être associés sont exportés
+        individuellement via `export_data`.
+
+        Args:
+            accounts_id (list[str]): Numéros de comptes à exporter.
+            from_date (str): Date de début des transactions (DD/MM/YYYY).
+            to_date (str): Date de fin des transactions (DD/MM/YYYY).
+            output_types (list[str]): Types d'exports demandés.
+            db_path (str): Chemin vers la base de données.
+            pg_uri (str): Chaîne de connexion à la base PostgreSQL.
+            export_path (str, optional): Chemin vers le dossier contenant les exports csv. Defaults to None.
+
+        Returns:
+            tuple[dict[str, bytes], str, str]: Export binaire de chaque compte (None si aucune opération), date de début et date de fin.
+        """
+        logger.info(f"Export des données du {from_date} au {to_date} pour les comptes {', '.join(accounts_id)}")
+
+        exports: dict[str, bytes] = {account_id: None for account_id in accounts_id}
+
+        if not self.__check_export_parameters(from_date, to_date):
+            return exports, from_date, to_date
+
+        # Correspondance entre numéros de comptes et identifiants de comptes
+        known_accounts: dict[str, str] = {}
+        if export_path is not None:
+            known_accounts.update(self.__get_known_accounts_from_csv(export_path, accounts_id))
+        for output_type in output_types:
+            if output_type == "sqlite" and db_path is not None and db_path != "":
+                known_accounts.update(self.__get_known_accounts(output_type, db_path))
+            elif output_type == "postgresql":
+                known_accounts.update(self.__get_known_accounts(output_type, pg_uri))
+
+        # Au-delà d'un compte sans correspondance connue, l'association par élimination est impossible
+        individual_ids: list[str] = []
+        unknown_ids: list[str] = [account_id for account_id in accounts_id if account_id not in known_accounts.values()]
+        if len(unknown_ids) > 1:
+            logger.warning(f"Aucune correspondance connue pour les comptes {', '.join(unknown_ids)}, ils seront exportés individuellement")
+            individual_ids = unknown_ids
+        grouped_ids: list[str] = [account_id for account_id in accounts_id if account_id not in individual_ids]
+
+        if len(grouped_ids) > 0:
+            data: bytes = self.__request_export(grouped_ids, from_date, to_date)
+            splitted_data: dict[str, bytes] = self.__split_by_account_num(data) if data is not None else {}
+
+            unmatched_nums: list[str] = []
+            for account_num, account_data in splitted_data.items():
+                account_id: str = known_accounts.get(account_num)
+                if account_id in grouped_ids and exports[account_id] is None:
+                    exports[account_id] = account_data
+                else:
+                    unmatched_nums.append(account_num)
+
+            if len(unmatched_nums) > 0:
+                unmatched_ids: list[str] = [account_id for account_id in grouped_ids if exports[account_id] is None]
+
+                # Association par élimination
+                if len(unmatched_nums) == 1 and len(unmatched_ids) == 1:
+                    logger.debug(f"Compte '{unmatched_ids[0]}' associé au numéro '{unmatched_nums[0]}' par élimination")
+                    exports[unmatched_ids[0]] = splitted_data[unmatched_nums[0]]
+                else:
+                    logger.warning(f"Impossible d'associer les opérations des numéros de comptes {', '.join(unmatched_nums)}")
+                    if len(unmatched_ids) > 0:
+                        logger.warning(f"Les comptes {', '.join(unmatched_ids)} seront exportés individuellement")
+                        individual_ids += unmatched_ids
+
+        # Export individuel des comptes qui n'ont pas pu être associés
+        for account_id in individual_ids:
+            exports[account_id] = self.export_data(account_id, from_date, to_date)[0]
+
+        return exports, from_date, to_date
+
 
     def write_to_csv(self, folder: str, account_id: str, data: bytes, from_date: str, to_date: str) -> str:
         """Enregistre l'export binaire dans un fichier csv sur le disque, dans le dossier spécifié.
@@ -316,11 +574,12 @@ class BoursoBankExporter:
         return export_file
     
 
-    def __create_db_table(self, cur: sqlite3.Cursor | psycopg.Cursor) -> list[str]:
+    def __create_db_table(self, cur: sqlite3.Cursor | psycopg.Cursor, partitioned: bool = False) -> list[str]:
         """Crée la table dans la base de données si elle n'existe pas.
 
         Args:
             cur (sqlite3.Cursor | psycopg.Cursor): Curseur de la base de données.
+            partitioned (bool, optional): Crée une table partitionnée par mois sur `dateOp` (PostgreSQL uniquement). Defaults to False.
 
         Returns:
             list[str]: Liste complète des champs de la table.
@@ -346,12 +605,149 @@ class BoursoBankExporter:
             fields_for_create.append(f"{field[0]} {field[1]}")
             fields_for_query.append(field[0])
 
-        req: str = f"CREATE TABLE IF NOT EXISTS client_{self.__client_id} ({', '.join(fields_for_create)});"
-        cur.execute(req)
+        if partitioned:
+            # Collation "C" pour que les bornes des partitions suivent l'ordre des dates au format YYYY-MM-DD
+            fields_for_create[0] = "dateOp TEXT COLLATE \"C\""
+            cur.execute(f"CREATE TABLE IF NOT EXISTS client_{self.__client_id} ({', '.join(fields_for_create)}) PARTITION BY RANGE (dateOp);")
+            # Partition par défaut pour les opérations sans date valide, si la table existante est bien partitionnée
+            if self.__is_partitioned_table(cur):
+                cur.execute(f"CREATE TABLE IF NOT EXISTS client_{self.__client_id}_default PARTITION OF client_{self.__client_id} DEFAULT;")
+        else:
+            req: str = f"CREATE TABLE IF NOT EXISTS client_{self.__client_id} ({', '.join(fields_for_create)});"
+            cur.execute(req)
 
         return fields_for_query
 
 
+    def __is_partitioned_table(self, cur: psycopg.Cursor) -> bool:
+        """Indique si la table du client est une table partitionnée.
+
+        Args:
+            cur (psycopg.Cursor): Curseur de la base de données.
+
+        Returns:
+            bool: True si la table est partitionnée.
+        """
+        row: any = cur.execute(f"SELECT relkind FROM pg_class WHERE relname = 'client_{self.__client_id}';").fetchone()
+        return row is not None and row[0] == "p"
+
+
+    def __get_month_partitions(self, cur: psycopg.Cursor) -> list[str]:
+        """Récupère les partitions mensuelles de la table du client, de la plus récente à la plus ancienne.
+
+        Args:
+            cur (psycopg.Cursor): Curseur de la base de données.
+
+        Returns:
+            list[str]: Noms des partitions mensuelles.
+        """
+        req: str = (f"SELECT c.relname FROM pg_inherits i "
+                    f"JOIN pg_class c ON c.oid = i.inhrelid "
+                    f"JOIN pg_class p ON p.oid = i.inhparent "
+                    f"WHERE p.relname = 'client_{self.__client_id}' AND c.relname <> 'client_{self.__client_id}_default' "
+                    f"ORDER BY c.relname DESC;")
+        return [row[0] for row in cur.execute(req).fetchall()]
+
+
+    def __get_last_partitioned_transaction_date(self, account_id: str, cur: psycopg.Cursor) -> tuple[str]:
+        """Récupère la date de l'opération la plus récente pour le compte spécifié, dans une table partitionnée.
+        Les partitions sont parcourues de la plus récente à la plus ancienne, afin de ne pas lire l'historique complet.
+
+        Args:
+            account_id (str): Numéro de compte pour lequel la dernière date doit être récupérée.
+            cur (psycopg.Cursor): Curseur de la base de données.
+
+        Returns:
+            tuple[str]: Ligne contenant la dernière date d'opération, ou None si aucune opération n'existe.
+        """
+        for partition in self.__get_month_partitions(cur):
+            row: any = cur.execute(f"SELECT MAX(dateOp) FROM {partition} WHERE accountId = '{account_id}';").fetchone()
+            if row is not None and row[0] is not None:
+                return row
+
+        return None
+
+
+    def __get_months(self, from_date: str, to_date: str) -> list[datetime.date]:
+        """Liste les mois (premier jour du mois) compris dans la période spécifiée.
+
+        Args:
+            from_date (str): Date de début (YYYY-MM-DD).
+            to_date (str): Date de fin (YYYY-MM-DD).
+
+        Returns:
+            list[datetime.date]: Premier jour de chaque mois de la période.
+        """
+        month: datetime.date = datetime.date(int(from_date[0:4]), int(from_date[5:7]), 1)
+        last_month: datetime.date = datetime.date(int(to_date[0:4]), int(to_date[5:7]), 1)
+
+        months: list[datetime.date] = []
+        while month <= last_month:
+            months.append(month)
+            month = self.__next_month(month)
+
+        return months
+
+
+    def __next_month(self, month: datetime.date) -> datetime.date:
+        """Retourne le premier jour du mois suivant.
+
+        Args:
+            month (datetime.date): Premier jour du mois.
+
+        Returns:
+            datetime.date: Premier jour du mois suivant.
+        """
+        if month.month == 12:
+            return datetime.date(month.year + 1, 1, 1)
+        return datetime.date(month.year, month.month + 1, 1)
+
+
+    def __create_partitions(self, account_id: str, months: list[datetime.date], cur: psycopg.Cursor) -> None:
+        """Crée les partitions mensuelles, et leur sous-partition pour le compte spécifié, si elles n'existent pas.
+
+        Args:
+            account_id (str): Identifiant du compte.
+            months (list[datetime.date]): Premier jour de chaque mois à créer.
+            cur (psycopg.Cursor): Curseur de la base de données.
+        """
+        for month in months:
+            month_table: str = f"client_{self.__client_id}_{month.strftime('%Y%m')}"
+            cur.execute(f"CREATE TABLE IF NOT EXISTS {month_table} PARTITION OF client_{self.__client_id} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{self.__next_month(month).isoformat()}') "
+                        f"PARTITION BY LIST (accountId);")
+            cur.execute(f"CREATE TABLE IF NOT EXISTS {month_table}_{account_id} PARTITION OF {month_table} FOR VALUES IN ('{account_id}');")
+
+
+    def __remove_same_period_partitioned(self, account_id: str, from_date: str, to_date: str, cur: psycopg.Cursor) -> None:
+        """Supprime les opérations sur la même période que celle demandée, dans une table partitionnée.
+        Les mois entièrement couverts par la période sont vidés par un TRUNCATE de leur partition,
+        seuls les mois partiellement couverts sont nettoyés ligne par ligne.
+
+        Args:
+            account_id (str): Identifiant du compte à nettoyer.
+            from_date (str): Date de début des transactions (DD/MM/YYYY).
+            to_date (str): Date de fin des transactions (DD/MM/YYYY).
+            cur (psycopg.Cursor): Curseur de la base de données.
+        """
+        logger.info("Suppression des opérations sur la même période pour éviter les doublons")
+
+        from_date = from_date[6:] + "-" + from_date[3:5] + "-" + from_date[0:2]
+        to_date = to_date[6:] + "-" + to_date[3:5] + "-" + to_date[0:2]
+
+        for month in self.__get_months(from_date, to_date):
+            month_end: datetime.date = self.__next_month(month) - datetime.timedelta(days=1)
+            partition: str = f"client_{self.__client_id}_{month.strftime('%Y%m')}_{account_id}"
+
+            if from_date <= month.isoformat() and month_end.isoformat() <= to_date:
+                logger.debug(f"Vidage de la partition '{partition}'")
+                cur.execute(f"TRUNCATE {partition};")
+            else:
+                month_from: str = max(from_date, month.isoformat())
+                month_to: str = min(to_date, month_end.isoformat())
+                cur.execute(f"DELETE FROM {partition} WHERE dateOp >= '{month_from}' AND dateOp <= '{month_to}';")
+
+
     def __init_sqlite_db(self, db_path: str) -> list[str]:
         """Crée la base de donnée si elle n'existe pas.
 
@@ -407,13 +803,16 @@ class BoursoBankExporter:
         cur.execute(f"DELETE FROM client_{self.__client_id} WHERE accountId = '{account_id}' AND category = 'Autorisation paiement / retrait en cours';")
 
 
-    def __insert_into_db(self, account_id: str, data: bytes, fields: list[str], cur: sqlite3.Cursor | psycopg.Cursor):
-        """Insère les données dans la base de données.
+    @staticmethod
+    def read_rows(account_id: str, data: bytes) -> list[dict[str, any]]:
+        """Décode l'export binaire en opérations prêtes à être insérées dans la base de données.
 
         Args:
             account_id (str): Identifiant du compte dont provient l'export.
             data (bytes): Export des transactions au format binaire.
-            cur (sqlite3.Cursor | psycopg.Cursor): Curseur de la base de données.
+
+        Returns:
+            list[dict[str, any]]: Opérations de l'export.
         """
         # Décodage des données
         io_data: io.StringIO = io.StringIO(data.decode("utf-8-sig"))
@@ -431,7 +830,18 @@ class BoursoBankExporter:
             else:
                 row["accountbalance"] = None
             rows.append(row)
-        
+
+        return rows
+
+
+    def __insert_into_db(self, rows: list[dict[str, any]], fields: list[str], cur: sqlite3.Cursor | psycopg.Cursor):
+        """Insère les données dans la base de données.
+
+        Args:
+            rows (list[dict[str, any]]): Opérations à insérer.
+            fields (list[str]): Paramètres de la requête d'insertion.
+            cur (sqlite3.Cursor | psycopg.Cursor): Curseur de la base de données.
+        """
         # Insertion des données
         logger.info(f"Insertion des données dans la table 'client_{self.__client_id}'")
         req: str = f"INSERT INTO client_{self.__client_id} VALUES ({','.join(fields)});"
@@ -439,7 +849,7 @@ class BoursoBankExporter:
         cur.executemany(req, tuple(rows))
 
 
-    def write_to_sqlite(self, account_id: str, data: bytes, from_date: str, to_date: str, db_path: str = "boursobank_exports.db") -> None:
+    def write_to_sqlite(self, account_id: str, data: bytes, from_date: str, to_date: str, db_path: str = "boursobank_exports.db", rows: list[dict[str, any]] = None) -> None:
         """Insert les opérations exportées dans une base de données SQLite.
 
         Args:
@@ -448,9 +858,10 @@ class BoursoBankExporter:
             from_date (str): Date de début des transactions (DD/MM/YYYY).
             to_date (str): Date de fin des transactions (DD/MM/YYYY).
             db_path (str, optional): Chemin vers la base de données SQLite. Defaults to "boursobank_exports.db".
+            rows (list[dict[str, any]], optional): Opérations déjà décodées (voir `read_rows`), utilisées à la place de `data`. Defaults to None.
         """
         logger.info("Import des données dans la base SQLite")
-        if data is None:
+        if data is None and rows is None:
             logger.warning("Le contenu de l'export est vide")
             return
 
@@ -470,16 +881,19 @@ class BoursoBankExporter:
 
         # Insertion des données
         fields = [f":{field}" for field in fields]
-        self.__insert_into_db(account_id, data, fields, cur)
+        if rows is None:
+            rows = self.read_rows(account_id, data)
+        self.__insert_into_db(rows, fields, cur)
         con.commit()
         con.close()
 
 
-    def __init_postgresql_db(self, pg_uri: str) -> list[str]:
+    def __init_postgresql_db(self, pg_uri: str, partitioned: bool = False) -> list[str]:
         """Initialise la base de données PostgreSQL.
 
         Args:
             pg_uri (str): Chaîne de connexion à la base PostgreSQL.
+            partitioned (bool, optional): Crée une table partitionnée par mois. Defaults to False.
 
         Returns:
             list[str]: Liste complète des champs de la table.
@@ -489,14 +903,14 @@ class BoursoBankExporter:
         # Création de la table si elle n'existe pas
         con: psycopg.Connection = psycopg.connect(pg_uri)
         cur: psycopg.Cursor = con.cursor()
-        fields_for_query = self.__create_db_table(cur)
+        fields_for_query = self.__create_db_table(cur, partitioned)
         con.commit()
         con.close()
 
         return fields_for_query
 
 
-    def write_to_postgresql(self, account_id: str, data: bytes, from_date: str, to_date: str, pg_uri: str) -> None:
+    def write_to_postgresql(self, account_id: str, data: bytes, from_date: str, to_date: str, pg_uri: str, partitioned: bool = False, rows: list[dict[str, any]] = None) -> None:
         """Insert les opérations exportées dans une base de données PostgreSQL.
 
         Args:
@@ -505,24 +919,237 @@ class BoursoBankExporter:
             from_date (str): Date de début des transactions (DD/MM/YYYY).
             to_date (str): Date de fin des transactions (DD/MM/YYYY).
             pg_uri (str): Chaîne de connexion à la base PostgreSQL.
+            partitioned (bool, optional): Utilise une table partitionnée par mois sur `dateOp`,
+                puis par compte. Ne s'applique qu'à la création de la table. Defaults to False.
+            rows (list[dict[str, any]], optional): Opérations déjà décodées (voir `read_rows`), utilisées à la place de `data`. Defaults to None.
         """
         logger.info("Import des données dans la base PostgreSQL")
-        if data is None:
+        if data is None and rows is None:
             logger.warning("Le contenu de l'export est vide")
             return
         
         # Initialisation de la DB
-        fields = self.__init_postgresql_db(pg_uri)
+        fields = self.__init_postgresql_db(pg_uri, partitioned)
+        if rows is None:
+            rows = self.read_rows(account_id, data)
 
-        # Suppression des anciennes opérations sur la même période
         con: psycopg.Connection = psycopg.connect(pg_uri)
         cur: psycopg.Cursor = con.cursor()
-        self.__remove_same_period(account_id, from_date, to_date, cur)
+
+        if self.__is_partitioned_table(cur):
+            # Création des partitions pour la période et pour les dates des opérations
+            iso_from_date: str = from_date[6:] + "-" + from_date[3:5] + "-" + from_date[0:2]
+            iso_to_date: str = to_date[6:] + "-" + to_date[3:5] + "-" + to_date[0:2]
+            months: set[datetime.date] = set(self.__get_months(iso_from_date, iso_to_date))
+            for row in rows:
+                if row["dateOp"] is not None and re.match(r"^\d{4}\-\d{2}\-\d{2}$", row["dateOp"]):
+                    months.update(self.__get_months(row["dateOp"], row["dateOp"]))
+            self.__create_partitions(account_id, sorted(months), cur)
+
+            # Suppression des anciennes opérations sur la même période
+            self.__remove_same_period_partitioned(account_id, from_date, to_date, cur)
+        else:
+            if partitioned:
+                logger.warning(f"La table 'client_{self.__client_id}' existe déjà et n'est pas partitionnée, elle sera utilisée telle quelle")
+
+            # Suppression des anciennes opérations sur la même période
+            self.__remove_same_period(account_id, from_date, to_date, cur)
         self.__remove_pending(account_id, cur)
         con.commit()
 
         # Insertion des données
         fields = [f"%({field})s" for field in fields]
-        self.__insert_into_db(account_id, data, fields, cur)
+        self.__insert_into_db(rows, fields, cur)
         con.commit()
         con.close()
+
+
+    @staticmethod
+    def read_export_file(account_id: str, export_file: str) -> list[dict[str, any]]:
+        """Lit et décode un fichier csv produit par `write_to_csv`.
+
+        Args:
+            account_id (str): Identifiant du compte dont provient l'export.
+            export_file (str): Chemin vers le fichier csv.
+
+        Returns:
+            list[dict[str, any]]: Opérations du fichier.
+        """
+        with open(export_file, "rb") as f:
+            return BoursoBankExporter.read_rows(account_id, f.read())
+
+
+    def __discover_exports(self, folder: str, accounts_id: list[str]) -> dict[str, list[tuple[str, str, str]]]:
+        """Recherche les fichiers csv produits par `write_to_csv` dans le dossier spécifié.
+
+        Les fichiers de chaque compte sont triés du plus récent au plus ancien : la date de modification du fichier
+        est prise en compte en priorité, puis la date de fin de l'export.
+
+        Args:
+            folder (str): Chemin vers le dossier contenant les exports csv.
+            accounts_id (list[str]): Comptes à réimporter. Si None, tous les comptes trouvés sont réimportés.
+
+        Returns:
+            dict[str, list[tuple[str, str, str]]]: Chemin, date de début et date de fin (YYYYMMDD) des fichiers de chaque compte.
+        """
+        pattern: re.Pattern = re.compile(r"^([\da-zA-Z]+)_(\d{8})-(\d{8})\.csv$")
+
+        exports: dict[str, list[tuple[float, str, str, str]]] = {}
+        for file_name in os.listdir(folder):
+            match: re.Match = pattern.match(file_name)
+            if match is None:
+                continue
+
+            account_id, from_date, to_date = match.groups()
+            if accounts_id is not None and account_id not in accounts_id:
+                continue
+
+            export_file: str = os.path.join(folder, file_name)
+            exports.setdefault(account_id, []).append((os.path.getmtime(export_file), export_file, from_date, to_date))
+
+        sorted_exports: dict[str, list[tuple[str, str, str]]] = {}
+        for account_id, files in exports.items():
+            files.sort(key=lambda file: (file[0], file[3]), reverse=True)
+            sorted_exports[account_id] = [file[1:] for file in files]
+
+        return sorted_exports
+
+
+    def __resolve_overlaps(self, files: list[tuple[str, str, str]]) -> list[tuple[str, str, str, list[tuple[str, str]]]]:
+        """Détermine, pour chaque fichier d'un compte, les périodes déjà couvertes par des fichiers plus récents.
+        Les fichiers entièrement couverts par des fichiers plus récents sont écartés.
+
+        Args:
+            files (list[tuple[str, str, str]]): Chemin, date de début et date de fin (YYYYMMDD) des fichiers, du plus récent au plus ancien.
+
+        Returns:
+            list[tuple[str, str, str, list[tuple[str, str]]]]: Fichiers conservés, avec les périodes (YYYYMMDD) couvertes par des fichiers plus récents.
+        """
+        resolved_files: list[tuple[str, str, str, list[tuple[str, str]]]] = []
+        covered_periods: list[tuple[str, str]] = []
+
+        for export_file, from_date, to_date in files:
+            if any(covered[0] <= from_date and to_date <= covered[1] for covered in covered_periods):
+                logger.debug(f"Fichier '{export_file}' ignoré, sa période est couverte par un export plus récent")
+                continue
+
+            resolved_files.append((export_file, from_date, to_date, list(covered_periods)))
+            covered_periods = self.__merge_periods(covered_periods + [(from_date, to_date)])
+
+        return resolved_files
+
+
+    def __merge_periods(self, periods: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Fusionne les périodes qui se chevauchent ou se suivent.
+
+        Args:
+            periods (list[tuple[str, str]]): Périodes (YYYYMMDD) à fusionner.
+
+        Returns:
+            list[tuple[str, str]]: Périodes fusionnées, triées par date de début.
+        """
+        sorted_periods: list[tuple[str, str]] = sorted(periods)
+        merged_periods: list[tuple[str, str]] = [sorted_periods[0]]
+        for period in sorted_periods[1:]:
+            last_period: tuple[str, str] = merged_periods[-1]
+            next_day: str = (datetime.datetime.strptime(last_period[1], "%Y%m%d") + datetime.timedelta(days=1)).strftime("%Y%m%d")
+            if period[0] <= next_day:
+                merged_periods[-1] = (last_period[0], max(last_period[1], period[1]))
+            else:
+                merged_periods.append(period)
+
+        return merged_periods
+
+
+    def reingest(self, folder: str, accounts_id: list[str], output_types: list[str], db_path: str, pg_uri: str, partitioned: bool = False, workers: int = None) -> None:
+        """Réimporte dans les bases SQLite et/ou PostgreSQL les fichiers csv produits par `write_to_csv`, sans connexion à BoursoBank.
+
+        Lorsque plusieurs fichiers d'un même compte se chevauchent, les opérations du fichier le plus récent sont conservées.
+        Les opérations en cours d'autorisation, ou sans date valide, ne sont conservées que pour le fichier le plus récent de chaque compte.
+        Les fichiers sont décodés en parallèle, puis les opérations de chaque compte sont insérées période par période :
+        seules les périodes effectivement couvertes par les fichiers sont remplacées dans les bases.
+
+        Args:
+            folder (str): Chemin vers le dossier contenant les exports csv.
+            accounts_id (list[str]): Comptes à réimporter. Si None, tous les comptes trouvés sont réimportés.
+            output_types (list[str]): Types d'exports demandés.
+            db_path (str): Chemin vers la base de données SQLite.
+            pg_uri (str): Chaîne de connexion à la base PostgreSQL.
+            partitioned (bool, optional): Utilise une table PostgreSQL partitionnée par mois. Defaults to False.
+            workers (int, optional): Nombre de processus utilisés pour décoder les fichiers. Defaults to None (nombre de processeurs).
+        """
+        if folder is None or folder == "":
+            folder = "."
+
+        logger.info(f"Réimport des exports csv du dossier '{folder}'")
+        if not os.path.isdir(folder):
+            logger.error(f"Le dossier '{folder}' n'existe pas")
+            return
+
+        exports: dict[str, list[tuple[str, str, str, list[tuple[str, str]]]]] = {}
+        for account_id, files in self.__discover_exports(folder, accounts_id).items():
+            exports[account_id] = self.__resolve_overlaps(files)
+            logger.info(f"{len(exports[account_id])} fichier(s) retenu(s) sur {len(files)} pour le compte {account_id}")
+
+        if len(exports) == 0:
+            logger.warning("Aucun export csv trouvé")
+            return
+
+        start_time: float = time.perf_counter()
+
+        # Décodage des fichiers en parallèle
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: dict[str, list] = {
+                account_id: [executor.submit(BoursoBankExporter.read_export_file, account_id, export[0]) for export in files]
+                for account_id, files in exports.items()
+            }
+
+            rows_by_account: dict[str, list[dict[str, any]]] = {}
+            for account_id, files in exports.items():
+                rows_by_account[account_id] = []
+                for index, (export, future) in enumerate(zip(files, futures[account_id])):
+                    for row in future.result():
+                        date_op: str = row["dateOp"].replace("-", "") if row["dateOp"] is not None else ""
+
+                        # Opérations sans date valide ou en cours d'autorisation des exports plus anciens
+                        if index > 0 and (not re.match(r"^\d{8}$", date_op) or row["category"] == "Autorisation paiement / retrait en cours"):
+                            continue
+                        # Opérations couvertes par un export plus récent
+                        if any(covered[0] <= date_op <= covered[1] for covered in export[3]):
+                            continue
+
+                        rows_by_account[account_id].append(row)
+
+        parse_time: float = time.perf_counter() - start_time
+        total_rows: int = sum(len(rows) for rows in rows_by_account.values())
+        logger.info(f"{total_rows} opérations décodées en {parse_time:.2f}s ({total_rows / max(parse_time, 1e-6):.0f} opérations/s)")
+
+        # Insertion des opérations de chaque compte, période couverte par période couverte
+        for account_id, files in exports.items():
+            periods: list[tuple[str, str]] = self.__merge_periods([(export[1], export[2]) for export in files])
+
+            # La période du fichier le plus récent est insérée en dernier, afin que ses opérations en cours
+            # d'autorisation ne soient pas supprimées par l'insertion des autres périodes
+            newest_period: tuple[str, str] = next(period for period in periods if period[0] <= files[0][1] and files[0][2] <= period[1])
+            periods.remove(newest_period)
+            periods.append(newest_period)
+
+            # Répartition des opérations par période, les opérations sans date valide étant rattachées à la période du fichier le plus récent
+            rows_by_period: dict[tuple[str, str], list[dict[str, any]]] = {period: [] for period in periods}
+            for row in rows_by_account[account_id]:
+                date_op: str = row["dateOp"].replace("-", "") if row["dateOp"] is not None else ""
+                period: tuple[str, str] = next((period for period in periods if period[0] <= date_op <= period[1]), newest_period)
+                rows_by_period[period].append(row)
+
+            for from_date, to_date in periods:
+                rows: list[dict[str, any]] = rows_by_period[(from_date, to_date)]
+                from_date = from_date[6:] + "/" + from_date[4:6] + "/" + from_date[0:4]
+                to_date = to_date[6:] + "/" + to_date[4:6] + "/" + to_date[0:4]
+
+                if "sqlite" in output_types:
+                    self.write_to_sqlite(account_id, None, from_date, to_date, db_path, rows)
+                if "postgresql" in output_types:
+                    self.write_to_postgresql(account_id, None, from_date, to_date, pg_uri, partitioned, rows)
+
+        total_time: float = time.perf_counter() - start_time
+        logger.info(f"{total_rows} opérations réimportées en {total_time:.2f}s ({total_rows / max(total_time, 1e-6):.0f} opérations/s)")
@@ -8,6 +8,11 @@ load_dotenv()
 
 # Arguments
 parser = argparse.ArgumentParser()
+parser.add_argument('command',
+                    nargs='?',
+                    choices=['export', 'reingest'],
+                    default='export',
+                    help="'export' pour exporter les opérations depuis BoursoBank, 'reingest' pour réimporter hors ligne les fichiers csv du dossier d'export dans les bases SQLite/PostgreSQL")
 parser.add_argument('--client-id',
                     '-u',
                     dest='client_id',
@@ -43,6 +48,12 @@ parser.add_argument('--postgresql-uri',
                     dest='postgresql_uri',
                     default=os.getenv("POSTGRESQL_CONN_STRING"),
                     help="Chaine de connexion à la base PostgreSQL")
+parser.add_argument('--postgresql-partitioned',
+                    '-pp',
+                    dest='postgresql_partitioned',
+                    action='store_true',
+                    default=os.getenv("POSTGRESQL_PARTITIONED", "").lower() in ["1", "true", "yes"],
+                    help="Crée la table PostgreSQL en la partitionnant par mois sur la date d'opération")
 parser.add_argument('--no-logs',
                     dest='no_logs',
                     action='store_true',
@@ -57,6 +68,17 @@ parser.add_argument('--to',
                     dest='to_date',
                     default=None,
                     help="Date de fin des transactions pour l'export")
+parser.add_argument('--single-request',
+                    '-s',
+                    dest='single_request',
+                    action='store_true',
+                    help="Exporte tous les comptes en une seule requête, sur une période commune, puis répartit les opérations par compte")
+parser.add_argument('--workers',
+                    '-w',
+                    dest='workers',
+                    type=int,
+                    default=None,
+                    help="Nombre de processus utilisés pour décoder les fichiers csv lors du réimport")
 args = parser.parse_args()
 
 # Logger
@@ -105,16 +127,16 @@ def validate_args() -> bool:
     elif not re.match(r"^\d+$", args.client_id):
         logger.error("L'identifiant client ne doit contenir que des chiffres.")
         return False
-    elif args.password is None:
+    elif args.command == "export" and args.password is None:
         logger.error("Le mot de passe doit être spécifié.")
         return False
-    elif not re.match(r"^\d+$", args.password):
+    elif args.command == "export" and not re.match(r"^\d+$", args.password):
         logger.error("Le mot de passe ne doit contenir que des chiffres.")
         return False
-    elif args.accounts_id is None:
+    elif args.command == "export" and args.accounts_id is None:
         logger.error("Au moins un numéro de compte doit être spécifié.")
         return False
-    elif not re.match(r"^[\da-zA-Z,]+$", args.accounts_id):
+    elif args.accounts_id is not None and not re.match(r"^[\da-zA-Z,]+$", args.accounts_id):
         logger.error("Les numéros de comptes ne doivent contenir que des chiffres et des lettres.")
         return False
     elif from_date is not None and not re.match(r"^\d{2}\/\d{2}\/\d{4}$", args.from_date):
@@ -138,10 +160,35 @@ def validate_args() -> bool:
         if output_type.strip() not in ["csv", "sqlite", "postgresql"]:
             logger.error(f"Le type d'export '{output_type}' est inconnu.")
             return False
+
+    if args.command == "reingest" and "sqlite" not in args.output_type.lower() and "postgresql" not in args.output_type.lower():
+        logger.error("Le réimport nécessite un type d'export 'sqlite' et/ou 'postgresql'.")
+        return False
+    elif args.workers is not None and args.workers < 1:
+        logger.error("Le nombre de processus doit être supérieur ou égal à 1.")
+        return False
     
     return True
 
 
+def write_export(bb_exporter: BoursoBankExporter, output_types: list[str], account_id: str, export: tuple[bytes, str, str]) -> None:
+    """Enregistre l'export d'un compte dans les différents types d'exports demandés.
+
+    Args:
+        bb_exporter (BoursoBankExporter): Exporteur BoursoBank.
+        output_types (list[str]): Types d'exports demandés.
+        account_id (str): Identifiant du compte dont provient l'export.
+        export (tuple[bytes, str, str]): Export binaire, date de début et date de fin.
+    """
+    if export[0] is not None:
+        if "csv" in output_types:
+            bb_exporter.write_to_csv(args.export_path, account_id, export[0], export[1], export[2])
+        if "sqlite" in output_types:
+            bb_exporter.write_to_sqlite(account_id, export[0], export[1], export[2], args.db_path)
+        if "postgresql" in output_types:
+            bb_exporter.write_to_postgresql(account_id, export[0], export[1], export[2], args.postgresql_uri, args.postgresql_partitioned)
+
+
 def main() -> None:
     """Fonction principale lors de l'exécution par ligne de commande
     """
@@ -152,6 +199,13 @@ def main() -> None:
     # Outputs
     output_types: list[str] = [output.strip() for output in args.output_type.lower().split(",")]
     
+    # Réimport hors ligne des exports csv
+    if args.command == "reingest":
+        accounts_id: list[str] = args.accounts_id.split(",") if args.accounts_id is not None else None
+        bb_exporter: BoursoBankExporter = BoursoBankExporter(offline=True, client_id=args.client_id)
+        bb_exporter.reingest(args.export_path, accounts_id, output_types, args.db_path, args.postgresql_uri, args.postgresql_partitioned, args.workers)
+        return
+
     # Liste des comptes
     accounts_id: list[str] = args.accounts_id.split(",")
 
@@ -159,18 +213,20 @@ def main() -> None:
     bb_exporter: BoursoBankExporter = BoursoBankExporter()
     bb_exporter.login(args.client_id, args.password)
 
+    # Export des opérations en une seule requête
+    if args.single_request:
+        from_to_dates: tuple[str, str] = bb_exporter.validate_shared_dates(accounts_id, args.from_date, args.to_date, output_types, args.db_path, args.postgresql_uri)
+        exports: tuple[dict[str, bytes], str, str] = bb_exporter.export_data_multi(accounts_id, from_to_dates[0], from_to_dates[1], output_types, args.db_path, args.postgresql_uri, args.export_path)
+
+        for account_id in accounts_id:
+            write_export(bb_exporter, output_types, account_id, (exports[0][account_id], exports[1], exports[2]))
+        return
+
     # Export des opérations
     for account_id in accounts_id:
         from_to_dates: tuple[str, str] = bb_exporter.validate_dates(account_id, args.from_date, args.to_date, output_types, args.db_path, args.postgresql_uri)
         export: tuple[bytes, str, str] = bb_exporter.export_data(account_id, from_to_dates[0], from_to_dates[1])
-
-        if export[0] is not None:
-            if "csv" in output_types:
-                bb_exporter.write_to_csv(args.export_path, account_id, export[0], export[1], export[2])
-            if "sqlite" in output_types:
-                bb_exporter.write_to_sqlite(account_id, export[0], export[1], export[2], args.db_path)
-            if "postgresql" in output_types:
-                bb_exporter.write_to_postgresql(account_id, export[0], export[1], export[2], args.postgresql_uri)
+        write_export(bb_exporter, output_types, account_id, export)
 
 
 if __name__ == "__main__":